@@ -4,24 +4,291 @@ Interactive cleanup tool for CReSO project.
 Provides safe, configurable cleanup with dry-run and backup capabilities.
 """
 
+import errno
 import os
+import re
+import stat
 import sys
 import shutil
 import argparse
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import (
+    List, Dict, Iterator, NamedTuple, Pattern, Set, Tuple, Optional
+)
 from datetime import datetime
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class _ScanEntry(NamedTuple):
+    """A single path recorded by the project tree scan."""
+
+    rel: str  # '/'-separated path relative to the project root
+    is_file: bool  # regular file or symlink
+    is_dir: bool
+    entry: os.DirEntry
+    # Directories only: how many entries lie below this one. The scan is in
+    # post-order, so those are exactly the entries immediately before it.
+    n_below: int
+    size: int  # file size, or total size of the files below a directory
+
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+_GLOB_CHARS = '*?['
+
+# FICLONE from <linux/fs.h>: make the destination share the source's extents
+_FICLONE = 0x40049409
+
+# Errors meaning a filesystem, or the pair of them, cannot clone at all
+_NO_REFLINK_ERRNOS = frozenset(
+    (errno.EOPNOTSUPP, errno.EXDEV, errno.EINVAL, errno.ENOTTY)
+)
+
+# st_dev of source filesystems a clone already failed on
+_no_reflink_devices: Set[int] = set()
+
+
+class FoundPath(NamedTuple):
+    """A path matched by a cleanup pattern, with its size in bytes."""
+
+    path: Path
+    size: int
+    is_dir: bool
+
+
+def _copy_file(src, dst):
+    """Copy a file with its metadata, cloning it where the filesystem can.
+
+    On copy-on-write filesystems (btrfs, XFS) a reflink clone takes constant
+    time whatever the file size. Elsewhere this falls back to ``copy2``,
+    whose ``copyfile`` already uses ``sendfile`` where the platform allows.
+    """
+    if fcntl is not None:
+        src_stat = os.stat(src)
+        # Only regular files can be cloned; opening e.g. a FIFO would block,
+        # and copy2 rejects special files itself
+        if (stat.S_ISREG(src_stat.st_mode)
+                and src_stat.st_dev not in _no_reflink_devices):
+            try:
+                with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                    fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            except OSError as e:
+                # Not supported here; copy2 below overwrites dst. Skip the
+                # attempt for later files from the same filesystem
+                if e.errno in _NO_REFLINK_ERRNOS:
+                    _no_reflink_devices.add(src_stat.st_dev)
+            else:
+                shutil.copystat(src, dst)
+                return dst
+    return shutil.copy2(src, dst)
+
+
+def _subtree_prefix(pattern: str) -> Optional[str]:
+    """Return the literal directory a pattern covers entirely, if any.
+
+    ``docs/**/*`` protects everything under ``docs``, so the walker can skip
+    that subtree instead of rejecting its contents one path at a time.
+    """
+    for suffix in ('/**/*', '/**'):
+        if pattern.endswith(suffix):
+            prefix = pattern[:-len(suffix)]
+            if prefix and not any(c in prefix for c in _GLOB_CHARS):
+                return prefix
+    return None
+
+
+def _listdir(path: str) -> List[os.DirEntry]:
+    """List a directory's entries, treating unreadable directories as empty."""
+    try:
+        with os.scandir(path) as it:
+            return list(it)
+    except OSError:
+        return []
+
+
+def _walk(root: str, pruned: Tuple[str, ...] = (), start: Optional[str] = None,
+          recursive: bool = True) -> Iterator[Tuple[os.DirEntry, int]]:
+    """Yield entries below ``start`` (default ``root``), not following symlinks.
+
+    Entries come in post-order, paired with the number of entries yielded
+    below them (always 0 for files), so every directory follows its own
+    contents. ``DirEntry`` type checks are answered from the directory
+    listing itself, so no per-entry ``stat()`` is issued while walking.
+    Directories whose path relative to ``root`` ends with one of the
+    ``pruned`` suffixes (each starting with ``os.sep``) are neither yielded
+    nor descended into.
+    """
+    root_len = len(root)
+    yielded = 0
+    # Frames of (unvisited entries, directory entry, yield count on entry)
+    stack = [(_listdir(start or root), None, 0)]
+    while stack:
+        pending, dir_entry, first = stack[-1]
+        if not pending:
+            stack.pop()
+            if dir_entry is not None:
+                yield dir_entry, yielded - first
+                yielded += 1
+            continue
+        entry = pending.pop()
+        if entry.is_dir(follow_symlinks=False):
+            if pruned and entry.path[root_len:].endswith(pruned):
+                continue
+            if recursive:
+                stack.append((_listdir(entry.path), entry, yielded))
+                continue
+        yield entry, 0
+        yielded += 1
+
+
+def _translate_set(body: str) -> str:
+    """Translate the inside of a glob ``[...]`` set into a regex set.
+
+    Follows ``fnmatch``: empty ranges such as ``z-a`` are dropped, and
+    characters the ``re`` module treats specially inside sets are escaped.
+    A negated set never matches '/', as globs match one segment at a time.
+    """
+    negated = body.startswith('!')
+    if negated:
+        body = body[1:]
+    if '-' not in body:
+        chunks = [body]
+    else:
+        # Split on the hyphens that form ranges; a leading one is literal
+        chunks = []
+        k = 1
+        start = 0
+        while True:
+            k = body.find('-', k)
+            if k < 0:
+                break
+            chunks.append(body[start:k])
+            start = k + 1
+            k += 3
+        if body[start:]:
+            chunks.append(body[start:])
+        else:
+            chunks[-1] += '-'
+        # Remove empty ranges -- invalid in a regex
+        for k in range(len(chunks) - 1, 0, -1):
+            if chunks[k - 1][-1] > chunks[k][0]:
+                chunks[k - 1] = chunks[k - 1][:-1] + chunks[k][1:]
+                del chunks[k]
+    # Escape everything but the range hyphens, including set operators
+    body = '-'.join(re.sub(r'([\\\-\[\]&~|^])', r'\\\1', c) for c in chunks)
+    if negated:
+        return f'[^/{body}]'
+    return f'[{body}]' if body else '(?!)'
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a glob into a regex whose wildcards never cross '/'.
+
+    Unlike ``fnmatch.translate``, ``*`` and ``?`` stay within one path
+    segment, matching the semantics of ``Path.rglob``/``PurePath.match``.
+    """
+    parts = []
+    i, n = 0, len(pattern)
+    while i < n:
+        char = pattern[i]
+        i += 1
+        if char == '*':
+            parts.append('[^/]*')
+        elif char == '?':
+            parts.append('[^/]')
+        elif char == '[':
+            j = i
+            if j < n and pattern[j] == '!':
+                j += 1
+            if j < n and pattern[j] == ']':
+                j += 1
+            j = pattern.find(']', j)
+            if j == -1:
+                parts.append('\\[')
+                continue
+            parts.append(_translate_set(pattern[i:j]))
+            i = j + 1
+        else:
+            parts.append(re.escape(char))
+    return ''.join(parts)
+
+
+def _compile_globs(patterns: List[str]) -> Optional[Pattern[str]]:
+    """Compile globs into one regex matched against relative paths.
+
+    Like ``rglob``, each pattern may match at any depth, so alternatives are
+    anchored to a segment boundary and to the end of the path.
+    """
+    if not patterns:
+        return None
+    alternatives = '|'.join(_glob_to_regex(p) for p in patterns)
+    return re.compile(f'(?:^|/)(?:{alternatives})\\Z')
+
+
+class _PatternSet(NamedTuple):
+    """Cleanup patterns split by target type into literals and globs.
+
+    Patterns without wildcards (``__pycache__``, ``benchmarks/results``) are
+    indexed by their final name; a path matches one when its name is a key
+    and it ends with one of the listed '/'-prefixed suffixes. Only the
+    remaining globs go through a regex.
+    """
+
+    dir_literals: Dict[str, Tuple[str, ...]]
+    dir_re: Optional[Pattern[str]]
+    file_literals: Dict[str, Tuple[str, ...]]
+    file_re: Optional[Pattern[str]]
+
+    @classmethod
+    def compile(cls, patterns: List[str]) -> "_PatternSet":
+        """Classify and compile a list of cleanup patterns."""
+        # Directory patterns end with '/', everything else matches files only
+        dir_patterns = [p.rstrip('/') for p in patterns if p.endswith('/')]
+        file_patterns = [p for p in patterns if not p.endswith('/')]
+
+        def is_literal(pattern: str) -> bool:
+            return not any(c in pattern for c in _GLOB_CHARS)
+
+        def index(literals: List[str]) -> Dict[str, Tuple[str, ...]]:
+            by_name: Dict[str, Tuple[str, ...]] = {}
+            for literal in literals:
+                name = literal.rsplit('/', 1)[-1]
+                by_name[name] = by_name.get(name, ()) + ('/' + literal,)
+            return by_name
+
+        return cls(
+            index(list(filter(is_literal, dir_patterns))),
+            _compile_globs([p for p in dir_patterns if not is_literal(p)]),
+            index(list(filter(is_literal, file_patterns))),
+            _compile_globs([p for p in file_patterns if not is_literal(p)]),
+        )
+
 
 class CReSOCleaner:
     """Interactive cleanup utility for CReSO project."""
 
     def __init__(self, config_path: Optional[str] = None):
-        self.project_root = Path(__file__).parent.parent
-        self.config_path = config_path or self.project_root / ".cleanrc"
+        self.project_root = Path(__file__).parent.parent.absolute()
+        self.config_path = Path(config_path or self.project_root / ".cleanrc")
         self.config = self.load_config()
         self.stats = {"files_deleted": 0, "dirs_deleted": 0, "space_freed": 0}
+        # Every scanned path starts with this, so relative paths are a slice
+        self._root_str = os.path.join(str(self.project_root), '')
+        self._all_paths: Optional[List[_ScanEntry]] = None
+        self._dir_index: Dict[str, int] = {}
+        # Directories protected wholesale are pruned from the walk
+        prefixes = filter(
+            None, map(_subtree_prefix, self.config["protected_patterns"])
+        )
+        self._pruned_dirs = tuple(os.sep + p.replace('/', os.sep) for p in prefixes)
+        self._protected_re = _compile_globs(self.config["protected_patterns"])
+        self._pattern_cache: Dict[Tuple[str, ...], _PatternSet] = {}
 
     def load_config(self) -> Dict:
         """Load cleanup configuration."""
@@ -74,128 +341,393 @@ class CReSOCleaner:
         except IOError as e:
             print(f"Error saving config: {e}")
 
-    def find_files(self, patterns: List[str]) -> List[Path]:
-        """Find files matching patterns."""
-        found_files = []
-        
-        for pattern in patterns:
-            if pattern.endswith('/'):
-                # Directory pattern
-                for path in self.project_root.rglob(pattern.rstrip('/')):
-                    if path.is_dir() and not self.is_protected(path):
-                        found_files.append(path)
+    def _scan_subtree(self, start: str, recursive: bool = True) -> List[_ScanEntry]:
+        """Record every entry below ``start``, in post-order.
+
+        Directory sizes are accumulated during the walk: ``running[i]`` is the
+        total size of the files among the first ``i`` entries, so a
+        directory's size is the difference across the entries below it.
+        """
+        entries = []
+        running = [0]
+        walk = _walk(str(self.project_root), self._pruned_dirs, start, recursive)
+        for entry, n_below in walk:
+            is_dir = entry.is_dir(follow_symlinks=False)
+            # Symlinks count as files, whatever they point to, so matching
+            # one removes the link and never its target
+            is_file = not is_dir and (
+                entry.is_file(follow_symlinks=False) or entry.is_symlink()
+            )
+            size = 0
+            if is_dir:
+                size = running[-1] - running[len(entries) - n_below]
+            elif is_file:
+                try:
+                    size = entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    pass
+            rel = self._relative(entry.path)
+            entries.append(_ScanEntry(rel, is_file, is_dir, entry, n_below, size))
+            running.append(running[-1] + (size if is_file else 0))
+        return entries
+
+    def _scan_tree(self) -> List[_ScanEntry]:
+        """Walk the project tree once and cache every path found."""
+        if self._all_paths is None:
+            top = self._scan_subtree(str(self.project_root), recursive=False)
+            entries = [e for e in top if not e.is_dir]
+            top_dirs = [e for e in top if e.is_dir]
+            # Walk each top-level directory on its own thread; scandir releases
+            # the GIL, so the directory reads overlap
+            workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                subtrees = pool.map(
+                    self._scan_subtree, [e.entry.path for e in top_dirs]
+                )
+                for top_dir, subtree in zip(top_dirs, subtrees):
+                    entries.extend(subtree)
+                    size = sum(e.size for e in subtree if e.is_file)
+                    entries.append(
+                        top_dir._replace(n_below=len(subtree), size=size)
+                    )
+            self._all_paths = entries
+            self._dir_index = {
+                e.rel: i for i, e in enumerate(entries) if e.is_dir
+            }
+        return self._all_paths
+
+    def _invalidate_scan(self):
+        """Forget the cached scan once the tree has been modified."""
+        self._all_paths = None
+        self._dir_index = {}
+
+    def _compile_patterns(self, patterns: List[str]) -> _PatternSet:
+        """Compile cleanup patterns, memoized per pattern list."""
+        key = tuple(patterns)
+        if key not in self._pattern_cache:
+            self._pattern_cache[key] = _PatternSet.compile(patterns)
+        return self._pattern_cache[key]
+
+    def _relative(self, path) -> str:
+        """Return ``path`` relative to the project root, '/'-separated.
+
+        Paths under the root, which includes everything produced by the
+        scan, are sliced instead of going through ``Path.relative_to``. Any
+        other path goes through it, so one outside the root raises
+        ``ValueError``.
+        """
+        path = str(path)
+        if not path.startswith(self._root_str):
+            return Path(path).relative_to(self.project_root).as_posix()
+        rel = path[len(self._root_str):]
+        return rel.replace(os.sep, '/') if os.sep != '/' else rel
+
+    def find_files_iter(self, patterns: List[str]) -> Iterator[FoundPath]:
+        """Yield paths matching patterns, straight from the cached scan.
+
+        Directories come before their contents, and the contents of a
+        matched directory are not yielded separately since they go with it.
+        """
+        pattern_set = self._compile_patterns(patterns)
+        protected_re = self._protected_re
+        entries = self._scan_tree()
+
+        # The scan is in post-order, so walking it backwards visits every
+        # directory before the entries below it
+        i = len(entries)
+        while i:
+            i -= 1
+            entry = entries[i]
+            if entry.is_dir:
+                literals, regex = pattern_set.dir_literals, pattern_set.dir_re
+            elif entry.is_file:
+                literals, regex = pattern_set.file_literals, pattern_set.file_re
             else:
-                # File pattern
-                for path in self.project_root.rglob(pattern):
-                    if path.is_file() and not self.is_protected(path):
-                        found_files.append(path)
-        
-        return sorted(set(found_files))
+                continue
+            suffixes = literals.get(entry.entry.name)
+            if suffixes is None or not ('/' + entry.rel).endswith(suffixes):
+                if regex is None or not regex.search(entry.rel):
+                    continue
+            if protected_re is not None and protected_re.search(entry.rel):
+                continue
+            yield FoundPath(Path(entry.entry.path), entry.size, entry.is_dir)
+            i -= entry.n_below
+
+    def find_files(self, patterns: List[str]) -> List[FoundPath]:
+        """Find files matching patterns, each with its size from the scan."""
+        return sorted(self.find_files_iter(patterns))
 
     def is_protected(self, path: Path) -> bool:
         """Check if path is protected from cleanup."""
-        relative_path = path.relative_to(self.project_root)
-        
-        for pattern in self.config["protected_patterns"]:
-            if relative_path.match(pattern):
-                return True
-        
-        return False
+        if self._protected_re is None:
+            return False
+        return self._protected_re.search(self._relative(path)) is not None
 
     def get_file_size(self, path: Path) -> int:
         """Get file or directory size in bytes."""
+        if self._dir_index and str(path).startswith(self._root_str):
+            # Directory sizes were already summed bottom-up by the scan
+            index = self._dir_index.get(self._relative(path))
+            if index is not None:
+                return self._all_paths[index].size
+
         if path.is_file():
             return path.stat().st_size
         elif path.is_dir():
             total_size = 0
-            try:
-                for item in path.rglob('*'):
-                    if item.is_file():
-                        total_size += item.stat().st_size
-            except (OSError, PermissionError):
-                pass
+            for entry, _ in _walk(str(path)):
+                # Type checks come from the directory listing; only the size
+                # needs a stat() call. Links count as in the scan
+                if entry.is_file(follow_symlinks=False) or entry.is_symlink():
+                    try:
+                        total_size += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        pass
             return total_size
         return 0
 
     def format_size(self, bytes_size: int) -> str:
         """Format bytes as human readable string."""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if bytes_size < 1024.0:
-                return f"{bytes_size:.1f} {unit}"
-            bytes_size /= 1024.0
-        return f"{bytes_size:.1f} TB"
-
-    def backup_file(self, file_path: Path, backup_dir: Path):
-        """Backup a file before deletion."""
+        # Each unit is 2**10 times the previous, so the bit length picks it
+        unit = min(max(0, (int(bytes_size).bit_length() - 1) // 10), 4)
+        return f"{bytes_size / (1 << (unit * 10)):.1f} {_SIZE_UNITS[unit]}"
+
+    def backup_file(self, file_path: Path, backup_dir: Path) -> bool:
+        """Backup a file before deletion.
+
+        When the backup location is on the same filesystem, the file is
+        moved there with a single rename instead of being copied. Returns
+        True in that case, meaning the original no longer needs deleting.
+        """
         backup_dir.mkdir(parents=True, exist_ok=True)
-        relative_path = file_path.relative_to(self.project_root)
+        relative_path = self._relative(file_path)
         backup_path = backup_dir / relative_path
         backup_path.parent.mkdir(parents=True, exist_ok=True)
-        
+
+        try:
+            source_dev = os.stat(file_path, follow_symlinks=False).st_dev
+        except FileNotFoundError:
+            return False
+        if (source_dev == os.stat(backup_path.parent).st_dev
+                and not os.path.lexists(backup_path)):
+            try:
+                os.rename(file_path, backup_path)
+                return True
+            except OSError:
+                pass  # e.g. moving a directory into itself; copy instead
+
         if file_path.is_file():
-            shutil.copy2(file_path, backup_path)
+            _copy_file(file_path, backup_path)
         elif file_path.is_dir():
-            shutil.copytree(file_path, backup_path, dirs_exist_ok=True)
+            shutil.copytree(file_path, backup_path, copy_function=_copy_file,
+                            dirs_exist_ok=True)
+        return False
+
+    def _remove_tree(self, path: Path):
+        """Delete a directory bottom-up from the scan, without re-walking it."""
+        index = None
+        if str(path).startswith(self._root_str):
+            index = self._dir_index.get(self._relative(path))
+        if index is None:
+            shutil.rmtree(path)
+            return
 
-    def delete_path(self, path: Path, backup: bool = False):
-        """Delete a file or directory with optional backup."""
+        start = index - self._all_paths[index].n_below
+        try:
+            for below in self._all_paths[start:index]:
+                try:
+                    if below.is_dir:
+                        os.rmdir(below.entry.path)
+                    else:
+                        os.unlink(below.entry.path)
+                except FileNotFoundError:
+                    # Removed earlier, e.g. as a separately matched path
+                    continue
+            os.rmdir(path)
+        except OSError:
+            # The directory changed since it was scanned
+            shutil.rmtree(path)
+
+    def delete_path(self, path: Path, backup: bool = False,
+                    size: Optional[int] = None):
+        """Delete a file or directory with optional backup.
+
+        ``size`` may be passed when already known to avoid measuring the
+        path again before deleting it.
+        """
+        if size is None:
+            size = self.get_file_size(path)
+
+        # One lstat answers both "does it still exist" and "is it a directory"
+        try:
+            is_dir = stat.S_ISDIR(os.lstat(path).st_mode)
+        except FileNotFoundError:
+            # Already removed, e.g. along with a matched parent directory
+            return
+
+        moved = False
         if backup:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_dir = self.project_root / self.config["backup_dir"] / timestamp
-            self.backup_file(path, backup_dir)
+            moved = self.backup_file(path, backup_dir)
 
-        size = self.get_file_size(path)
-        
-        if path.is_file():
-            path.unlink()
-            self.stats["files_deleted"] += 1
-        elif path.is_dir():
-            shutil.rmtree(path)
+        if is_dir:
+            if not moved:
+                self._remove_tree(path)
             self.stats["dirs_deleted"] += 1
-        
+        else:
+            if not moved:
+                path.unlink()
+            self.stats["files_deleted"] += 1
+
         self.stats["space_freed"] += size
 
-    def clean_category(self, category: str, patterns: List[str], 
-                      dry_run: bool = False, backup: bool = False,
-                      interactive: bool = True) -> Tuple[List[Path], int]:
-        """Clean files matching category patterns."""
-        files_to_clean = self.find_files(patterns)
-        total_size = sum(self.get_file_size(f) for f in files_to_clean)
-        
-        if not files_to_clean:
+    def _plan_category(self, patterns: List[str]) -> Tuple[List[FoundPath], int]:
+        """Find a category's files and their total size, without deleting."""
+        files = self.find_files(patterns)
+        return files, sum(f.size for f in files)
+
+    def _show_plan(self, category: str, files: List[FoundPath], total_size: int):
+        """Print what a category would delete."""
+        if not files:
             print(f"No {category} files found to clean.")
-            return files_to_clean, total_size
+            return
 
-        print(f"\n{category.upper()} files found ({len(files_to_clean)} items, {self.format_size(total_size)}):")
+        print(f"\n{category.upper()} files found ({len(files)} items, {self.format_size(total_size)}):")
         
-        for i, file_path in enumerate(files_to_clean[:10]):  # Show first 10
-            rel_path = file_path.relative_to(self.project_root)
-            size = self.format_size(self.get_file_size(file_path))
+        for found in files[:10]:  # Show first 10
+            rel_path = self._relative(found.path)
+            size = self.format_size(found.size)
             print(f"  {rel_path} ({size})")
         
-        if len(files_to_clean) > 10:
-            print(f"  ... and {len(files_to_clean) - 10} more files")
+        if len(files) > 10:
+            print(f"  ... and {len(files) - 10} more files")
+
+    def _execute_category(self, category: str, files: List[FoundPath],
+                          total_size: int, backup: bool = False):
+        """Delete a planned category's files."""
+        for found in files:
+            try:
+                self.delete_path(found.path, backup, found.size)
+            except (OSError, PermissionError) as e:
+                print(f"Warning: Could not delete {found.path}: {e}")
+        print(f"✓ Deleted {len(files)} {category} files ({self.format_size(total_size)})")
+
+    def clean_category(self, category: str, patterns: List[str], 
+                      dry_run: bool = False, backup: bool = False,
+                      interactive: bool = True) -> Tuple[int, int]:
+        """Clean files matching category patterns.
+
+        Returns the number of items found and their total size in bytes.
+        """
+        files_to_clean, total_size = self._plan_category(patterns)
+        self._show_plan(category, files_to_clean, total_size)
+        if not files_to_clean:
+            return 0, total_size
 
         if dry_run:
             print(f"[DRY RUN] Would delete {len(files_to_clean)} {category} files")
-            return files_to_clean, total_size
+            return len(files_to_clean), total_size
 
         if interactive:
             response = input(f"Delete these {category} files? [y/N/s(kip)]: ").lower().strip()
             if response == 's':
-                return files_to_clean, 0
+                return len(files_to_clean), 0
             elif response != 'y':
-                return files_to_clean, 0
-
-        # Delete files
-        for file_path in files_to_clean:
-            try:
-                self.delete_path(file_path, backup)
-            except (OSError, PermissionError) as e:
-                print(f"Warning: Could not delete {file_path}: {e}")
-
-        print(f"✓ Deleted {len(files_to_clean)} {category} files ({self.format_size(total_size)})")
-        return files_to_clean, total_size
+                return len(files_to_clean), 0
+
+        self._execute_category(category, files_to_clean, total_size, backup)
+        self._invalidate_scan()
+        return len(files_to_clean), total_size
+
+    def _without_overlaps(self, plans: Dict[str, Tuple[List[FoundPath], int]],
+                          categories: List[str]
+                          ) -> Dict[str, Tuple[List[FoundPath], int]]:
+        """Restrict plans to ``categories``, keeping each path only once.
+
+        A path is dropped when it lies under a directory planned by another
+        of the categories, or when an earlier category already planned it,
+        so nothing is counted or deleted twice.
+        """
+        planned_dirs = {
+            self._relative(found.path)
+            for category in categories
+            for found in plans[category][0] if found.is_dir
+        }
+        seen = set()
+        result = {}
+        for category in categories:
+            kept = []
+            for found in plans[category][0]:
+                rel = self._relative(found.path)
+                parent, covered = rel, False
+                while '/' in parent and not covered:
+                    parent = parent.rsplit('/', 1)[0]
+                    covered = parent in planned_dirs
+                if covered or rel in seen:
+                    continue
+                seen.add(rel)
+                kept.append(found)
+            if kept:
+                result[category] = (kept, sum(f.size for f in kept))
+        return result
+
+    def _clean_unattended(self, categories: List[str], backup: bool = False):
+        """Delete every category's files without asking, from one scan.
+
+        All categories are planned before anything is deleted, so they
+        share the cached scan, and deleting one category never forces a
+        rescan for the next.
+        """
+        plans = {
+            category: self._plan_category(self.config["cleanup_patterns"][category])
+            for category in categories
+        }
+        to_delete = self._without_overlaps(plans, categories)
+        for category in categories:
+            files, total_size = to_delete.get(category, ([], 0))
+            self._show_plan(category, files, total_size)
+            if files:
+                self._execute_category(category, files, total_size, backup)
+
+    def _clean_batch(self, categories: List[str], backup: bool = False):
+        """Plan every category from one scan, then confirm once and delete.
+
+        Asking once at the end means the user is not kept waiting on the
+        scan between prompts, and every category shares the cached scan.
+        """
+        plans = {}
+        for category in categories:
+            patterns = self.config["cleanup_patterns"][category]
+            files, total_size = self._plan_category(patterns)
+            self._show_plan(category, files, total_size)
+            if files:
+                plans[category] = (files, total_size)
+
+        if not plans:
+            return
+
+        combined = self._without_overlaps(plans, list(plans))
+        n_items = sum(len(files) for files, _ in combined.values())
+        total_size = sum(size for _, size in combined.values())
+        print(f"\nTotal: {n_items} items in {len(combined)} categories "
+              f"({self.format_size(total_size)})")
+        response = input(
+            "Delete these files? [y/N/c(hoose per category)]: "
+        ).lower().strip()
+        if response == 'y':
+            chosen = list(plans)
+        elif response == 'c':
+            chosen = [
+                category for category in plans
+                if input(f"Delete {category} files? [y/N]: ").lower().strip() == 'y'
+            ]
+        else:
+            chosen = []
+
+        to_delete = self._without_overlaps(plans, chosen)
+        for category, (files, total_size) in to_delete.items():
+            self._execute_category(category, files, total_size, backup)
 
     def run_cleanup(self, categories: List[str], dry_run: bool = False, 
                    backup: bool = False, interactive: bool = True):
@@ -211,14 +743,22 @@ class CReSOCleaner:
         
         total_files_found = 0
         total_size_found = 0
-        
-        for category in categories:
-            if category in self.config["cleanup_patterns"]:
+        categories = [c for c in categories if c in self.config["cleanup_patterns"]]
+
+        if not dry_run:
+            if interactive:
+                self._clean_batch(categories, backup)
+            else:
+                self._clean_unattended(categories, backup)
+            # Every category was planned from the one scan, now out of date
+            self._invalidate_scan()
+        else:
+            for category in categories:
                 patterns = self.config["cleanup_patterns"][category]
-                files, size = self.clean_category(
+                count, size = self.clean_category(
                     category, patterns, dry_run, backup, interactive
                 )
-                total_files_found += len(files)
+                total_files_found += count
                 total_size_found += size
 
         print(f"\n📊 Cleanup Summary:")
@@ -234,9 +774,11 @@ class CReSOCleaner:
         """List available cleanup categories."""
         print("Available cleanup categories:")
         for category, patterns in self.config["cleanup_patterns"].items():
-            files = self.find_files(patterns)
-            total_size = sum(self.get_file_size(f) for f in files)
-            print(f"  {category:12} - {len(files):3} items ({self.format_size(total_size)})")
+            count = total_size = 0
+            for found in self.find_files_iter(patterns):
+                count += 1
+                total_size += found.size
+            print(f"  {category:12} - {count:3} items ({self.format_size(total_size)})")
 
 
 def main():
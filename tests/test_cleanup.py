@@ -0,0 +1,971 @@
+"""Test suite for the scripts/cleanup.py project cleanup tool."""
+
+import errno
+import importlib.util
+import json
+import os
+import random
+import shutil
+import sys
+import warnings
+from pathlib import Path, PurePosixPath
+
+import pytest
+
+SCRIPT = Path(__file__).parent.parent / "scripts" / "cleanup.py"
+
+DEFAULT_CATEGORIES = {
+    "cache": ["__pycache__", ".pytest_cache", ".mypy_cache", ".ruff_cache"],
+    "python_compiled": ["*.pyc", "*.pyo"],
+    "logs": ["*.log", "*.out", "*.err"],
+    "results": ["*.png", "*.jpg", "*.csv", "results/", "benchmarks/results/"],
+    "build": ["build/", "dist/", "*.egg-info/"],
+}
+
+
+def load_cleanup(root: Path):
+    """Import a copy of the cleanup script placed under ``root/scripts``.
+
+    The cleaner derives its project root from the script location, so each
+    test gets its own copy rooted at a temporary directory.
+    """
+    scripts_dir = root / "scripts"
+    scripts_dir.mkdir(parents=True, exist_ok=True)
+    target = scripts_dir / "cleanup.py"
+    shutil.copy(SCRIPT, target)
+
+    spec = importlib.util.spec_from_file_location(f"cleanup_{id(root)}", target)
+    module = importlib.util.module_from_spec(spec)
+    dont_write_bytecode = sys.dont_write_bytecode
+    sys.dont_write_bytecode = True  # Keep __pycache__ out of the scanned tree
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        sys.dont_write_bytecode = dont_write_bytecode
+    return module
+
+
+def write(path: Path, size: int = 1):
+    """Create a file of ``size`` bytes, with any missing parents."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+
+
+def baseline_find_files(root: Path, patterns, protected_patterns):
+    """Find files the way the original rglob-per-pattern implementation did.
+
+    Directories protected wholesale by a ``<dir>/**/*`` pattern are skipped
+    entirely, as the walk now prunes them, and paths inside a matched
+    directory are left out since they are deleted along with it.
+    """
+    pruned = tuple(p[:-len("/**/*")] for p in protected_patterns
+                   if p.endswith("/**/*"))
+    found = set()
+    for pattern in patterns:
+        if pattern.endswith("/"):
+            candidates = [p for p in root.rglob(pattern.rstrip("/")) if p.is_dir()]
+        else:
+            candidates = [p for p in root.rglob(pattern) if p.is_file()]
+        for path in candidates:
+            relative_path = path.relative_to(root)
+            if relative_path.parts[0] in pruned:
+                continue
+            if not any(relative_path.match(p) for p in protected_patterns):
+                found.add(path)
+    dirs = {path for path in found if path.is_dir()}
+    return sorted(p for p in found if not dirs.intersection(p.parents))
+
+
+def relative_paths(root: Path, found) -> set:
+    return {f.path.relative_to(root).as_posix() for f in found}
+
+
+@pytest.fixture
+def cleanup(tmp_path):
+    """The cleanup module, rooted at an otherwise empty project."""
+    return load_cleanup(tmp_path)
+
+
+@pytest.fixture
+def project(tmp_path, cleanup):
+    """A small project tree, returned as (root, cleaner)."""
+    write(tmp_path / "README.md", 3)
+    write(tmp_path / "LICENSE", 4)
+    write(tmp_path / ".git" / "logs" / "HEAD", 5)
+    write(tmp_path / "docs" / "top.png", 6)
+    write(tmp_path / "docs" / "api" / "plot.png", 7)
+    write(tmp_path / "examples" / "notebooks" / "n.ipynb", 8)
+    write(tmp_path / "examples" / "notebooks" / "out.png", 9)
+    write(tmp_path / "results" / "r.csv", 10)
+    write(tmp_path / "results" / "sub" / "fig.png", 100)
+    write(tmp_path / "bench" / "benchmarks" / "results" / "b.json", 11)
+    write(tmp_path / "creso" / "__pycache__" / "m.pyc", 12)
+    write(tmp_path / "creso" / "x.pyc", 13)
+    write(tmp_path / "logs" / "run.log", 14)
+    write(tmp_path / "plot_1.png", 15)
+    return tmp_path, cleanup.CReSOCleaner()
+
+
+class TestGlobTranslation:
+    """Test the glob to regex translation against PurePath.match."""
+
+    PATTERNS = [
+        "*.md", "LICENSE", "docs/**/*", "examples/notebooks/*.ipynb",
+        "creso_*_model*", "*.egg-info", "benchmarks/results", ".coverage*",
+        "x?y", "[ab]*.txt", "a[!b]c", "[z-a]x", "[a--b]", "[[]x", "[a&&b]",
+        "[a||b]", "[a-]", "[-a]", "[]]", "[!]]x", "[^a]", "x[a-c-e]",
+    ]
+    PATHS = [
+        "README.md", "a/b/c.md", "LICENSE", "a/LICENSE", "docs/a/b", "docs/a",
+        "x/docs/a/b", "examples/notebooks/n.ipynb",
+        "examples/notebooks/s/n.ipynb", "creso_a_model", "creso_a/b_model",
+        "q.egg-info", "a.egg-info/x", "benchmarks/results",
+        "z/benchmarks/results", "benchmarks/results/x", ".coverage.x", "xzy",
+        "x/y", "a.txt", "b/c.txt", "axc", "abc", "a/xc", "zx", "-", "b", "[x",
+        "&", "|", "]", "!x", "^", "a", "xb", "xd", "x-",
+    ]
+
+    @pytest.mark.parametrize("pattern", PATTERNS)
+    def test_matches_purepath(self, cleanup, pattern):
+        """Test every pattern agrees with PurePath.match on sample paths."""
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            regex = cleanup._compile_globs([pattern])
+
+        for path in self.PATHS:
+            expected = PurePosixPath(path).match(pattern)
+            assert bool(regex.search(path)) == expected, (pattern, path)
+
+    def test_empty_pattern_list(self, cleanup):
+        """Test an empty pattern list compiles to no regex."""
+        assert cleanup._compile_globs([]) is None
+
+
+class TestFindFiles:
+    """Test pattern matching over the scanned project tree."""
+
+    @pytest.mark.parametrize("category", sorted(DEFAULT_CATEGORIES))
+    def test_matches_baseline(self, project, category):
+        """Test each default category finds what rglob per pattern found."""
+        root, cleaner = project
+        patterns = DEFAULT_CATEGORIES[category]
+
+        expected = baseline_find_files(
+            root, patterns, cleaner.config["protected_patterns"]
+        )
+
+        assert [f.path for f in cleaner.find_files(patterns)] == expected
+
+    def test_file_and_directory_patterns(self, project):
+        """Test file globs, directory names and multi-segment directories."""
+        root, cleaner = project
+
+        found = cleaner.find_files(["*.pyc", "logs/", "benchmarks/results/"])
+
+        assert relative_paths(root, found) == {
+            "creso/__pycache__/m.pyc",
+            "creso/x.pyc",
+            "logs",
+            "bench/benchmarks/results",
+        }
+
+    def test_file_patterns_do_not_match_directories(self, project):
+        """Test patterns without a trailing '/' only match files."""
+        root, cleaner = project
+
+        assert cleaner.find_files(["__pycache__", "logs"]) == []
+
+    def test_protected_and_pruned_paths(self, project):
+        """Test protected files and pruned subtrees never match."""
+        root, cleaner = project
+
+        found = relative_paths(root, cleaner.find_files(["*.png", "*.ipynb"]))
+
+        assert "docs/top.png" not in found
+        assert "docs/api/plot.png" not in found
+        assert "examples/notebooks/n.ipynb" not in found
+        assert "examples/notebooks/out.png" in found
+        assert "plot_1.png" in found
+
+    def test_pruned_directories_are_not_scanned(self, project):
+        """Test wholly protected directories are skipped by the walk."""
+        root, cleaner = project
+
+        scanned = {entry.rel for entry in cleaner._scan_tree()}
+
+        assert not any(rel.split("/")[0] in (".git", "docs") for rel in scanned)
+        assert cleaner.find_files(["logs/"])[0].path == root / "logs"
+
+    def test_scan_is_cached_until_cleaning(self, project):
+        """Test the tree is scanned once and rescanned after deleting."""
+        root, cleaner = project
+        cleaner.find_files(["*.pyc"])
+        write(root / "late.pyc")
+
+        assert "late.pyc" not in relative_paths(root, cleaner.find_files(["*.pyc"]))
+
+        cleaner.clean_category("logs", ["*.log"], interactive=False)
+
+        assert "late.pyc" in relative_paths(root, cleaner.find_files(["*.pyc"]))
+
+    def test_nested_matches_collapse_into_directory(self, project):
+        """Test matches inside a matched directory are not listed again."""
+        root, cleaner = project
+
+        found = cleaner.find_files(["results/", "*.png", "*.csv"])
+
+        paths = relative_paths(root, found)
+        assert "results" in paths
+        assert "results/r.csv" not in paths
+        assert "results/sub/fig.png" not in paths
+        assert "plot_1.png" in paths
+
+    def test_sizes(self, project):
+        """Test found files and directories carry their sizes."""
+        root, cleaner = project
+
+        sizes = {
+            f.path.relative_to(root).as_posix(): (f.size, f.is_dir)
+            for f in cleaner.find_files(["results/", "*.pyc"])
+        }
+
+        assert sizes["results"] == (110, True)
+        assert sizes["creso/x.pyc"] == (13, False)
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="needs symlinks")
+    def test_symlinks_match_file_patterns(self, tmp_path, cleanup):
+        """Test a symlink matches as a file, whatever it points to."""
+        write(tmp_path / "run.log")
+        (tmp_path / "data").mkdir()
+        os.symlink("run.log", tmp_path / "latest.log")
+        os.symlink("missing", tmp_path / "dangling.log")
+        os.symlink("data", tmp_path / "dir.log")
+
+        found = cleanup.CReSOCleaner().find_files(["*.log"])
+
+        assert relative_paths(tmp_path, found) == {
+            "run.log", "latest.log", "dangling.log", "dir.log"
+        }
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="needs symlinks")
+    def test_cleaning_symlinks_removes_only_links(self, tmp_path, cleanup):
+        """Test matched symlinks are unlinked without touching their targets."""
+        write(tmp_path / "data" / "keep.txt")
+        os.symlink("missing", tmp_path / "dangling.log")
+        os.symlink("data", tmp_path / "dir.log")
+        cleaner = cleanup.CReSOCleaner()
+
+        cleaner.clean_category("logs", ["*.log"], interactive=False)
+
+        assert not os.path.lexists(tmp_path / "dangling.log")
+        assert not os.path.lexists(tmp_path / "dir.log")
+        assert (tmp_path / "data" / "keep.txt").exists()
+        assert cleaner.stats["files_deleted"] == 2
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="needs symlinks")
+    def test_symlinked_directories_are_not_followed(self, tmp_path, cleanup):
+        """Test the walk never descends through a directory symlink."""
+        write(tmp_path / "outside" / "keep.log")
+        (tmp_path / "project").mkdir()
+        os.symlink(tmp_path / "outside", tmp_path / "project" / "link")
+        cleaner = load_cleanup(tmp_path / "project").CReSOCleaner()
+
+        cleaner.clean_category("logs", ["*.log"], interactive=False)
+
+        assert (tmp_path / "outside" / "keep.log").exists()
+    def test_literal_patterns(self, cleanup):
+        """Test wildcard-free patterns are indexed by their final name."""
+        pattern_set = cleanup._PatternSet.compile(
+            ["results/", "benchmarks/results/", "*.egg-info/", "coverage.xml",
+             "*.log"]
+        )
+
+        assert pattern_set.dir_literals == {
+            "results": ("/results", "/benchmarks/results")
+        }
+        assert pattern_set.file_literals == {"coverage.xml": ("/coverage.xml",)}
+        assert pattern_set.dir_re.search("a.egg-info")
+        assert pattern_set.file_re.search("x/run.log")
+
+    def test_literal_names_match_at_any_depth(self, tmp_path, cleanup):
+        """Test literal names match like rglob, files and directories apart."""
+        write(tmp_path / "coverage.xml")
+        write(tmp_path / "a" / "b" / "coverage.xml")
+        write(tmp_path / "htmlcov" / "index.html")
+        write(tmp_path / "results")
+
+        found = cleanup.CReSOCleaner().find_files(
+            ["coverage.xml", "htmlcov/", "results/"]
+        )
+
+        assert relative_paths(tmp_path, found) == {
+            "coverage.xml", "a/b/coverage.xml", "htmlcov"
+        }
+
+    def test_multi_segment_literals(self, tmp_path, cleanup):
+        """Test static paths match at any depth, but only as whole segments."""
+        write(tmp_path / "benchmarks" / "results" / "a.json")
+        write(tmp_path / "x" / "benchmarks" / "results" / "b.json")
+        write(tmp_path / "mybenchmarks" / "results" / "c.json")
+        write(tmp_path / "other" / "results" / "d.json")
+        write(tmp_path / "y" / "reports" / "coverage.xml")
+
+        found = cleanup.CReSOCleaner().find_files(
+            ["benchmarks/results/", "reports/coverage.xml"]
+        )
+
+        assert relative_paths(tmp_path, found) == {
+            "benchmarks/results", "x/benchmarks/results",
+            "y/reports/coverage.xml",
+        }
+
+    def test_compiled_patterns_are_reused(self, project):
+        """Test each pattern list is compiled only once per cleaner."""
+        root, cleaner = project
+
+        first = cleaner._compile_patterns(["*.pyc", "logs/"])
+
+        assert cleaner._compile_patterns(["*.pyc", "logs/"]) is first
+
+
+class TestScan:
+    """Test the cached tree scan."""
+
+    def test_scan_covers_tree(self, project):
+        """Test the threaded scan records every unpruned path once."""
+        root, cleaner = project
+
+        expected = set()
+        for dirpath, dirnames, filenames in os.walk(root):
+            rel = Path(dirpath).relative_to(root).as_posix()
+            if rel.split("/")[0] in (".git", "docs"):
+                continue
+            for name in dirnames + filenames:
+                expected.add(name if rel == "." else f"{rel}/{name}")
+        expected -= {".git", "docs"}
+
+        scanned = [entry.rel for entry in cleaner._scan_tree()]
+        assert len(scanned) == len(set(scanned))
+        assert set(scanned) == expected
+
+    def test_post_order_and_directory_sizes(self, project):
+        """Test each directory follows its contents and sums their sizes."""
+        root, cleaner = project
+        entries = cleaner._scan_tree()
+
+        for i, entry in enumerate(entries):
+            if not entry.is_dir:
+                continue
+            below = entries[i - entry.n_below:i]
+            expected = {
+                e.rel for e in entries if e.rel.startswith(entry.rel + "/")
+            }
+            assert {e.rel for e in below} == expected
+            walked = sum(
+                os.lstat(os.path.join(dirpath, name)).st_size
+                for dirpath, _, filenames in os.walk(root / entry.rel)
+                for name in filenames
+            )
+            assert entry.size == sum(e.size for e in below if e.is_file) == walked
+
+    def test_get_file_size(self, project):
+        """Test get_file_size agrees with the sizes recorded by the scan."""
+        root, cleaner = project
+
+        for entry in cleaner._scan_tree():
+            if entry.is_dir or entry.is_file:
+                assert cleaner.get_file_size(root / entry.rel) == entry.size
+        assert cleaner.get_file_size(root / "missing") == 0
+
+    def test_get_file_size_reuses_scan(self, project, cleanup, monkeypatch):
+        """Test scanned directories are measured without walking them again."""
+        root, cleaner = project
+        cleaner._scan_tree()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("the scan should be reused")
+
+        monkeypatch.setattr(cleanup, "_walk", fail)
+
+        assert cleaner.get_file_size(root / "results") == 110
+        assert cleaner.get_file_size(root / "results" / "sub") == 100
+
+    def test_get_file_size_outside_project(self, project):
+        """Test a path outside the root is measured, not looked up."""
+        root, cleaner = project
+        outside = Path(str(root) + "-other") / "results"
+        write(outside / "r.csv", 7)
+        cleaner._scan_tree()
+
+        assert cleaner.get_file_size(outside) == 7
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="needs symlinks")
+    def test_get_file_size_counts_links_not_targets(self, tmp_path, cleanup):
+        """Test a directory's size includes its links but not their targets."""
+        write(tmp_path / "data" / "big.bin", 1000)
+        write(tmp_path / "logs" / "run.log", 10)
+        os.symlink(tmp_path / "data", tmp_path / "logs" / "data")
+        cleaner = cleanup.CReSOCleaner()
+        link_size = os.lstat(tmp_path / "logs" / "data").st_size
+
+        assert cleaner.get_file_size(tmp_path / "logs") == 10 + link_size
+
+    def test_unreadable_directory_is_skipped(self, project, monkeypatch):
+        """Test a directory that cannot be listed is treated as empty."""
+        root, cleaner = project
+        scandir = os.scandir
+
+        def failing_scandir(path):
+            if os.path.basename(path) == "creso":
+                raise PermissionError(path)
+            return scandir(path)
+
+        monkeypatch.setattr(os, "scandir", failing_scandir)
+        scanned = {entry.rel for entry in cleaner._scan_tree()}
+
+        assert "creso" in scanned
+        assert "creso/x.pyc" not in scanned
+        assert "logs/run.log" in scanned
+
+
+def baseline_format_size(bytes_size) -> str:
+    """Format sizes the way the original unit loop did."""
+    for unit in ["B", "KB", "MB", "GB"]:
+        if bytes_size < 1024.0:
+            return f"{bytes_size:.1f} {unit}"
+        bytes_size /= 1024.0
+    return f"{bytes_size:.1f} TB"
+
+
+class TestFormatSize:
+    """Test human readable size formatting."""
+
+    EDGES = sorted({
+        max(0, 1024 ** k + d) for k in range(6) for d in (-1, 0, 1)
+    } | {0, 1, 1023, 1536, 10 ** 15, 2 ** 60})
+
+    @pytest.mark.parametrize("size", EDGES)
+    def test_unit_boundaries(self, cleanup, size):
+        """Test sizes around every unit boundary match the unit loop."""
+        cleaner = cleanup.CReSOCleaner()
+
+        assert cleaner.format_size(size) == baseline_format_size(size)
+
+    def test_random_sizes(self, cleanup):
+        """Test sizes of every magnitude match the unit loop."""
+        cleaner = cleanup.CReSOCleaner()
+        rng = random.Random(0)
+
+        for _ in range(20000):
+            size = rng.getrandbits(rng.randint(0, 56))
+            assert cleaner.format_size(size) == baseline_format_size(size)
+
+    def test_examples(self, cleanup):
+        """Test a few sizes in each unit."""
+        cleaner = cleanup.CReSOCleaner()
+
+        assert cleaner.format_size(0) == "0.0 B"
+        assert cleaner.format_size(1536) == "1.5 KB"
+        assert cleaner.format_size(5 * 1024 ** 3) == "5.0 GB"
+        assert cleaner.format_size(2048 * 1024 ** 4) == "2048.0 TB"
+
+
+class TestIsProtected:
+    """Test the protected pattern check."""
+
+    PATHS = [
+        "README.md", "a/b/NOTES.md", "LICENSE", "creso/LICENSE", "Makefile",
+        "pyproject.toml", "sub/pyproject.toml", "examples/notebooks/n.ipynb",
+        "examples/notebooks/out.png", "x/examples/notebooks/n.ipynb",
+        "docs/a/b", "docs/a", ".git/logs/HEAD", "plot.png", "md", "LICENSE.txt",
+    ]
+
+    @pytest.mark.parametrize("rel", PATHS)
+    def test_matches_purepath(self, tmp_path, cleanup, rel):
+        """Test the compiled check agrees with PurePath.match per pattern."""
+        cleaner = cleanup.CReSOCleaner()
+        patterns = cleaner.config["protected_patterns"]
+
+        expected = any(PurePosixPath(rel).match(p) for p in patterns)
+
+        assert cleaner.is_protected(tmp_path / rel) == expected
+
+    def test_path_outside_project(self, tmp_path, cleanup):
+        """Test paths outside the project root are rejected, not matched."""
+        cleaner = cleanup.CReSOCleaner()
+
+        with pytest.raises(ValueError):
+            cleaner.is_protected(Path("README.md"))
+        with pytest.raises(ValueError):
+            cleaner.is_protected(tmp_path.parent / "other" / "README.md")
+
+    def test_path_sharing_root_prefix(self, tmp_path, cleanup):
+        """Test a sibling whose name extends the root's is not sliced."""
+        cleaner = cleanup.CReSOCleaner()
+        sibling = Path(str(tmp_path) + "-other") / "README.md"
+
+        with pytest.raises(ValueError):
+            cleaner.is_protected(sibling)
+
+    def test_no_protected_patterns(self, tmp_path, cleanup):
+        """Test nothing is protected when the config lists no patterns."""
+        config_path = tmp_path / "cleanrc.json"
+        config_path.write_text(json.dumps({"protected_patterns": []}))
+        write(tmp_path / "README.md")
+        cleaner = cleanup.CReSOCleaner(config_path)
+
+        assert not cleaner.is_protected(tmp_path / "README.md")
+        assert cleaner.find_files(["*.md"])[0].path == tmp_path / "README.md"
+
+
+def failing_rename(src, dst):
+    """Stand in for os.rename across filesystems."""
+    raise OSError(errno.EXDEV, os.strerror(errno.EXDEV))
+
+
+class TestDeletePath:
+    """Test deleting paths with and without backups."""
+
+    def test_delete_file(self, project):
+        """Test deleting a single file."""
+        root, cleaner = project
+
+        cleaner.delete_path(root / "plot_1.png")
+
+        assert not (root / "plot_1.png").exists()
+        assert cleaner.stats == {
+            "files_deleted": 1, "dirs_deleted": 0, "space_freed": 15
+        }
+
+    def test_delete_directory(self, project):
+        """Test deleting a directory counts the size passed in."""
+        root, cleaner = project
+
+        cleaner.delete_path(root / "results", size=110)
+
+        assert not (root / "results").exists()
+        assert cleaner.stats == {
+            "files_deleted": 0, "dirs_deleted": 1, "space_freed": 110
+        }
+
+    def test_delete_scanned_directory(self, project, monkeypatch):
+        """Test scanned directories are removed without rmtree."""
+        root, cleaner = project
+        cleaner._scan_tree()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("rmtree should not be needed")
+
+        monkeypatch.setattr(shutil, "rmtree", fail)
+        cleaner.delete_path(root / "results", size=110)
+
+        assert not (root / "results").exists()
+        assert cleaner.stats["dirs_deleted"] == 1
+
+    def test_delete_directory_changed_since_scan(self, project):
+        """Test files created after the scan are still removed."""
+        root, cleaner = project
+        cleaner._scan_tree()
+        write(root / "results" / "late.csv")
+
+        cleaner.delete_path(root / "results")
+
+        assert not (root / "results").exists()
+
+    def test_delete_directory_outside_project(self, project):
+        """Test a path outside the root never resolves to a scanned one."""
+        root, cleaner = project
+        outside = Path(str(root) + "-other") / "results"
+        write(outside / "r.csv")
+        cleaner._scan_tree()
+
+        cleaner.delete_path(outside)
+
+        assert not outside.exists()
+        assert (root / "results" / "r.csv").exists()
+        assert (root / "results" / "sub" / "fig.png").exists()
+
+    def test_delete_with_known_size_stats_once(self, project, monkeypatch):
+        """Test deleting a scanned path costs a single lstat and no stat."""
+        root, cleaner = project
+        found = {
+            f.path: f for f in cleaner.find_files(["results/", "*.png"])
+        }
+        lstat = os.lstat
+        lstats = []
+
+        def counting_lstat(path, *args, **kwargs):
+            lstats.append(path)
+            return lstat(path, *args, **kwargs)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("no stat() should be needed")
+
+        monkeypatch.setattr(os, "lstat", counting_lstat)
+        monkeypatch.setattr(os, "stat", fail)
+        for path in (root / "results", root / "plot_1.png"):
+            cleaner.delete_path(path, size=found[path].size)
+
+        assert lstats == [root / "results", root / "plot_1.png"]
+        assert cleaner.stats == {
+            "files_deleted": 1, "dirs_deleted": 1, "space_freed": 125
+        }
+
+    def test_delete_missing_path(self, project):
+        """Test an already removed path is skipped without counting it."""
+        root, cleaner = project
+
+        cleaner.delete_path(root / "missing", size=100)
+
+        assert cleaner.stats == {
+            "files_deleted": 0, "dirs_deleted": 0, "space_freed": 0
+        }
+
+    def test_paths_inside_deleted_directory_count_once(self, project):
+        """Test matches removed with their parent are not counted again."""
+        root, cleaner = project
+
+        cleaner.clean_category("results", ["results/", "*.csv"], interactive=False)
+
+        assert not (root / "results").exists()
+        assert cleaner.stats == {
+            "files_deleted": 0, "dirs_deleted": 2, "space_freed": 121
+        }
+
+    def test_backup_keeps_relative_layout(self, project):
+        """Test backups mirror the path relative to the project root."""
+        root, cleaner = project
+
+        cleaner.delete_path(root / "results", backup=True)
+
+        backups = list((root / "cleanup_backups").iterdir())
+        assert len(backups) == 1
+        assert (backups[0] / "results" / "sub" / "fig.png").stat().st_size == 100
+        assert not (root / "results").exists()
+        assert cleaner.stats["dirs_deleted"] == 1
+
+    def test_backup_moves_path(self, project):
+        """Test backups on the same filesystem move the original."""
+        root, cleaner = project
+        inode = (root / "results" / "r.csv").stat().st_ino
+
+        cleaner.delete_path(root / "results", backup=True)
+
+        backups = list((root / "cleanup_backups").iterdir())
+        assert (backups[0] / "results" / "r.csv").stat().st_ino == inode
+
+    def test_backup_copies_when_target_exists(self, project):
+        """Test an existing backup target falls back to copying."""
+        root, cleaner = project
+        backup_dir = root / "cleanup_backups" / "manual"
+        write(backup_dir / "plot_1.png")
+
+        assert cleaner.backup_file(root / "plot_1.png", backup_dir) is False
+        assert (root / "plot_1.png").exists()
+        assert (backup_dir / "plot_1.png").read_bytes() == b"x" * 15
+
+    def test_backup_copies_directory_across_filesystems(self, project,
+                                                        monkeypatch):
+        """Test directories are copied when they cannot be moved."""
+        root, cleaner = project
+        monkeypatch.setattr(os, "rename", failing_rename)
+
+        cleaner.delete_path(root / "results", backup=True)
+
+        backup = next((root / "cleanup_backups").iterdir()) / "results"
+        assert (backup / "sub" / "fig.png").read_bytes() == b"x" * 100
+        assert not (root / "results").exists()
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs FIFOs")
+    def test_copy_fifo_does_not_block(self, tmp_path, cleanup):
+        """Test copying a FIFO fails fast instead of waiting for a writer."""
+        os.mkfifo(tmp_path / "pipe")
+
+        with pytest.raises(shutil.SpecialFileError):
+            cleanup._copy_file(tmp_path / "pipe", tmp_path / "copy")
+
+    @pytest.mark.parametrize("error, attempts", [
+        (errno.EOPNOTSUPP, 1), (errno.EXDEV, 1), (errno.EIO, 2),
+    ])
+    def test_clone_failure_is_remembered(self, tmp_path, cleanup, monkeypatch,
+                                         error, attempts):
+        """Test a filesystem that cannot clone is not asked again."""
+        calls = []
+
+        class FakeFcntl:
+            @staticmethod
+            def ioctl(fd, request, arg):
+                calls.append(request)
+                raise OSError(error, os.strerror(error))
+
+        monkeypatch.setattr(cleanup, "fcntl", FakeFcntl)
+        monkeypatch.setattr(cleanup, "_no_reflink_devices", set())
+        write(tmp_path / "a.bin", 5)
+        write(tmp_path / "b.bin", 6)
+
+        cleanup._copy_file(tmp_path / "a.bin", tmp_path / "a.copy")
+        cleanup._copy_file(tmp_path / "b.bin", tmp_path / "b.copy")
+
+        assert len(calls) == attempts
+        assert (tmp_path / "a.copy").read_bytes() == b"x" * 5
+        assert (tmp_path / "b.copy").read_bytes() == b"x" * 6
+
+    def test_backup_outside_project(self, tmp_path, cleanup):
+        """Test a path outside the project is neither backed up nor deleted."""
+        outside = Path(str(tmp_path) + "-other") / "run.log"
+        write(outside)
+        cleaner = cleanup.CReSOCleaner()
+
+        with pytest.raises(ValueError):
+            cleaner.delete_path(outside, backup=True)
+
+        assert outside.exists()
+
+
+def count_scans(cleaner, monkeypatch) -> list:
+    """Record every full tree scan the cleaner starts."""
+    scans = []
+    scan_subtree = cleaner._scan_subtree
+
+    def counting_scan_subtree(start, recursive=True):
+        if not recursive:  # The top level is listed once per scan
+            scans.append(start)
+        return scan_subtree(start, recursive)
+
+    monkeypatch.setattr(cleaner, "_scan_subtree", counting_scan_subtree)
+    return scans
+
+
+class TestListCategories:
+    """Test the category listing."""
+
+    def test_counts_and_sizes(self, project, capsys):
+        """Test each category lists what find_files would return."""
+        root, cleaner = project
+
+        cleaner.list_categories()
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0] == "Available cleanup categories:"
+        for category, patterns in cleaner.config["cleanup_patterns"].items():
+            found = cleaner.find_files(patterns)
+            size = cleaner.format_size(sum(f.size for f in found))
+            assert f"  {category:12} - {len(found):3} items ({size})" in lines
+
+    def test_scans_once(self, project, monkeypatch):
+        """Test listing every category walks the tree a single time."""
+        root, cleaner = project
+        scans = count_scans(cleaner, monkeypatch)
+        cleaner.list_categories()
+
+        assert len(scans) == 1
+
+
+class TestRunCleanup:
+    """Test whole cleanup runs across categories."""
+
+    def test_dry_run_deletes_nothing(self, project, capsys):
+        """Test a dry run reports every category and leaves the tree alone."""
+        root, cleaner = project
+
+        cleaner.run_cleanup(["results", "python_compiled"], dry_run=True,
+                            interactive=False)
+
+        output = capsys.readouterr().out
+        assert "RESULTS files found (4 items, 145.0 B):" in output
+        assert "[DRY RUN] Would delete 2 python_compiled files" in output
+        assert "Total files that would be deleted: 6" in output
+        assert "Total space that would be freed: 170.0 B" in output
+        assert (root / "results").exists()
+        assert (root / "creso" / "x.pyc").exists()
+        assert cleaner.stats["space_freed"] == 0
+
+    def test_unattended_run_scans_once(self, project, monkeypatch):
+        """Test a non-interactive run plans every category from one scan."""
+        root, cleaner = project
+        scans = count_scans(cleaner, monkeypatch)
+        cleaner.run_cleanup(list(DEFAULT_CATEGORIES), interactive=False)
+
+        assert len(scans) == 1
+        assert not (root / "results").exists()
+        assert not (root / "creso" / "__pycache__" / "m.pyc").exists()
+        assert not (root / "logs" / "run.log").exists()
+        assert cleaner._all_paths is None
+
+    def test_unattended_output(self, project, capsys):
+        """Test each category prints its summary before being deleted."""
+        root, cleaner = project
+
+        cleaner.run_cleanup(["logs", "build"], interactive=False)
+
+        output = capsys.readouterr().out
+        assert "LOGS files found (1 items, 14.0 B):" in output
+        assert "  logs/run.log (14.0 B)" in output
+        assert "✓ Deleted 1 logs files (14.0 B)" in output
+        assert "No build files found to clean." in output
+        assert cleaner.stats == {
+            "files_deleted": 1, "dirs_deleted": 0, "space_freed": 14
+        }
+
+    @pytest.mark.parametrize("categories", [
+        ["python_compiled", "results"],
+        ["results", "python_compiled"],
+    ])
+    def test_unattended_overlapping_categories(self, tmp_path, cleanup, capsys,
+                                               categories):
+        """Test paths under another category's directory count once."""
+        write(tmp_path / "b" / "results" / "z.pyc", 25)
+        write(tmp_path / "x.pyc", 3)
+        cleaner = cleanup.CReSOCleaner()
+
+        cleaner.run_cleanup(categories, interactive=False)
+
+        output = capsys.readouterr().out
+        assert "✓ Deleted 1 python_compiled files (3.0 B)" in output
+        assert "✓ Deleted 1 results files (25.0 B)" in output
+        assert cleaner.stats == {
+            "files_deleted": 1, "dirs_deleted": 1, "space_freed": 28
+        }
+        assert not (tmp_path / "b" / "results").exists()
+        assert not (tmp_path / "x.pyc").exists()
+
+
+def answer(monkeypatch, *responses):
+    """Feed ``responses`` to input() in order, recording the prompts."""
+    prompts = []
+    pending = list(responses)
+
+    def fake_input(prompt):
+        prompts.append(prompt)
+        return pending.pop(0)
+
+    monkeypatch.setattr("builtins.input", fake_input)
+    return prompts
+
+
+class TestCleanBatch:
+    """Test batched interactive cleanup across categories."""
+
+    def test_single_confirmation(self, project, monkeypatch, capsys):
+        """Test every category is shown and confirmed with one prompt."""
+        root, cleaner = project
+        prompts = answer(monkeypatch, "y")
+        scans = count_scans(cleaner, monkeypatch)
+
+        cleaner.run_cleanup(["logs", "python_compiled", "build"])
+
+        output = capsys.readouterr().out
+        assert "LOGS files found (1 items, 14.0 B):" in output
+        assert "No build files found to clean." in output
+        assert "Total: 3 items in 2 categories (39.0 B)" in output
+        assert len(prompts) == 1
+        assert len(scans) == 1
+        assert cleaner.stats["space_freed"] == 39
+        assert cleaner._all_paths is None
+
+    def test_declined(self, project, monkeypatch):
+        """Test answering no deletes nothing."""
+        root, cleaner = project
+        answer(monkeypatch, "n")
+
+        cleaner.run_cleanup(["results", "logs"])
+
+        assert (root / "results").exists()
+        assert (root / "logs" / "run.log").exists()
+        assert cleaner.stats["space_freed"] == 0
+
+    def test_choose_per_category(self, project, monkeypatch):
+        """Test 'c' asks about each category without rescanning."""
+        root, cleaner = project
+        prompts = answer(monkeypatch, "c", "n", "y")
+        scans = count_scans(cleaner, monkeypatch)
+
+        cleaner.run_cleanup(["results", "logs"])
+
+        assert prompts[1:] == [
+            "Delete results files? [y/N]: ", "Delete logs files? [y/N]: "
+        ]
+        assert len(scans) == 1
+        assert (root / "results").exists()
+        assert not (root / "logs" / "run.log").exists()
+
+    @pytest.mark.parametrize("categories", [
+        ["python_compiled", "results"],
+        ["results", "python_compiled"],
+    ])
+    def test_overlapping_categories(self, tmp_path, cleanup, monkeypatch,
+                                    capsys, categories):
+        """Test paths under another category's directory count once."""
+        write(tmp_path / "b" / "results" / "z.pyc", 25)
+        write(tmp_path / "x.pyc", 3)
+        answer(monkeypatch, "y")
+        cleaner = cleanup.CReSOCleaner()
+
+        cleaner.run_cleanup(categories)
+
+        output = capsys.readouterr().out
+        assert "Total: 2 items in 2 categories (28.0 B)" in output
+        assert "✓ Deleted 1 python_compiled files (3.0 B)" in output
+        assert "✓ Deleted 1 results files (25.0 B)" in output
+        assert cleaner.stats == {
+            "files_deleted": 1, "dirs_deleted": 1, "space_freed": 28
+        }
+        assert not (tmp_path / "b" / "results").exists()
+        assert not (tmp_path / "x.pyc").exists()
+
+    def test_category_emptied_by_overlap(self, tmp_path, cleanup, monkeypatch,
+                                         capsys):
+        """Test a category left with nothing to delete is not counted."""
+        write(tmp_path / "b" / "results" / "z.pyc", 25)
+        answer(monkeypatch, "y")
+        cleaner = cleanup.CReSOCleaner()
+
+        cleaner.run_cleanup(["python_compiled", "results"])
+
+        output = capsys.readouterr().out
+        assert "Total: 1 items in 1 categories (25.0 B)" in output
+        assert "python_compiled files (" not in output.split("Total:")[1]
+        assert "✓ Deleted 1 results files (25.0 B)" in output
+        assert cleaner.stats["space_freed"] == 25
+
+
+class TestConfig:
+    """Test configuration loading and saving."""
+
+    def test_config_path_given_as_string(self, tmp_path, cleanup):
+        """Test a --config style string path is loaded and merged."""
+        config_path = tmp_path / "my.json"
+        config_path.write_text(json.dumps({"cleanup_patterns": {"x": ["*.x"]}}))
+
+        cleaner = cleanup.CReSOCleaner(str(config_path))
+
+        assert cleaner.config["cleanup_patterns"] == {"x": ["*.x"]}
+        assert "*.md" in cleaner.config["protected_patterns"]
+
+    def test_invalid_config_uses_defaults(self, tmp_path, cleanup, capsys):
+        """Test unreadable JSON falls back to the built-in configuration."""
+        config_path = tmp_path / "broken.json"
+        config_path.write_text("{")
+
+        cleaner = cleanup.CReSOCleaner(str(config_path))
+
+        assert "Warning: Could not load config" in capsys.readouterr().out
+        assert "results" in cleaner.config["cleanup_patterns"]
+
+    def test_defaults_are_not_shared(self, tmp_path, cleanup):
+        """Test changing one cleaner's config leaves the next one untouched."""
+        first = cleanup.CReSOCleaner(str(tmp_path / "missing.json"))
+        first.config["cleanup_patterns"]["logs"].append("*.bak")
+
+        second = cleanup.CReSOCleaner(str(tmp_path / "missing.json"))
+
+        assert "*.bak" not in second.config["cleanup_patterns"]["logs"]
+
+    def test_save_config(self, tmp_path, cleanup):
+        """Test a saved config loads back unchanged."""
+        config_path = tmp_path / "saved.json"
+        cleaner = cleanup.CReSOCleaner(str(config_path))
+
+        cleaner.save_config()
+
+        assert json.loads(config_path.read_text()) == cleaner.config